@@ -1,57 +1,36 @@
 #!/usr/bin/env python3
 """
 Clean up malformed raw tags and properly fix template literals.
+
+The actual transform lives in fix_liquid.py; this script applies it to
+one known-problematic file.
 """
 
-import re
+from fix_liquid import transform
 
 def clean_and_fix_file(filepath):
-    """Remove all raw tags and properly re-apply them."""
-    
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Remove all existing raw tags
-    content = re.sub(r'\{\% raw \%\}\n?', '', content)
-    content = re.sub(r'\n?\{\% endraw \%\}', '', content)
-    
-    # Now properly wrap code blocks that contain template literals
-    lines = content.split('\n')
-    result_lines = []
-    in_code_block = False
-    code_block_lines = []
-    
-    for line in lines:
-        if line.strip().startswith('```'):
-            if in_code_block:
-                # End of code block - check if it has template literals
-                code_content = '\n'.join(code_block_lines)
-                if '${' in code_content:
-                    # Wrap the entire code block content with raw tags
-                    result_lines.append('{% raw %}')
-                    result_lines.extend(code_block_lines)
-                    result_lines.append('{% endraw %}')
-                else:
-                    result_lines.extend(code_block_lines)
-                result_lines.append(line)  # Add closing ```
-                code_block_lines = []
-                in_code_block = False
-            else:
-                # Start of code block
-                result_lines.append(line)  # Add opening ```
-                in_code_block = True
-        elif in_code_block:
-            code_block_lines.append(line)
-        else:
-            result_lines.append(line)
-    
-    return '\n'.join(result_lines)
+    """Remove all raw tags and properly re-apply them.
+
+    Returns (original, fixed) so the caller can skip the write when
+    nothing changed.
+    """
+
+    with open(filepath, 'rb') as f:
+        original = f.read()
+
+    # Cheap scan first - nothing to clean or wrap in most files
+    if b'${' not in original and b'{% raw %}' not in original:
+        return original, original
+
+    return original, transform(original)
 
 # Fix the problematic file
 filepath = '01-JavaScript-Prerequisites/01-ES6-Features.md'
-fixed_content = clean_and_fix_file(filepath)
-
-with open(filepath, 'w', encoding='utf-8') as f:
-    f.write(fixed_content)
+original, fixed_content = clean_and_fix_file(filepath)
 
-print(f"Cleaned and fixed: {filepath}")
+if fixed_content != original:
+    with open(filepath, 'wb') as f:
+        f.write(fixed_content)
+    print(f"Cleaned and fixed: {filepath}")
+else:
+    print(f"No changes needed: {filepath}")
@@ -1,73 +1,156 @@
 #!/usr/bin/env python3
+import hashlib
+import json
 import re
-import glob
+import mmap
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+# Content hashes of files already known to need no changes; lets repeated
+# runs (CI, pre-commit) skip the transform entirely
+_CACHE_PATH = '.fix_liquid_cache.json'
+
+def _content_hash(content):
+    """Hex digest keying the transform cache (blake2b, faster than sha1)."""
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+def _load_cache():
+    try:
+        with open(_CACHE_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_cache(cache):
+    # Write-then-rename so a crash never leaves a truncated cache
+    tmp_path = _CACHE_PATH + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(cache, f)
+    os.replace(tmp_path, _CACHE_PATH)
+
+# Alternation strips both opening and closing raw tags in a single pass.
+# Patterns and fixups all operate on bytes: the markers are pure ASCII and
+# UTF-8 is self-synchronizing, so byte-level matching is safe and skips the
+# decode/encode round trip entirely.
+_STRIP_RAW_RE = re.compile(rb'\{\% raw \%\}\n?|\n?\{\% endraw \%\}')
+
+def _find_fence(content, pos):
+    """Return the index of a ``` that starts a line at or after pos, or -1."""
+    if pos == 0 and content.startswith(b'```'):
+        return 0
+    i = content.find(b'\n```', max(pos - 1, 0))
+    return i + 1 if i != -1 else -1
 
 def fix_template_literals(content):
-    """Fix template literals by wrapping entire code blocks with raw tags."""
-    lines = content.split('\n')
-    result_lines = []
-    in_code_block = False
-    code_block_lines = []
-    
-    for line in lines:
-        if line.strip().startswith('```'):
-            if in_code_block:
-                # End of code block - check if it has template literals
-                code_content = '\n'.join(code_block_lines)
-                if '${' in code_content:
-                    # Wrap the entire code block content with raw tags
-                    result_lines.append('{% raw %}')
-                    result_lines.extend(code_block_lines)
-                    result_lines.append('{% endraw %}')
-                else:
-                    result_lines.extend(code_block_lines)
-                result_lines.append(line)  # Add closing ```
-                code_block_lines = []
-                in_code_block = False
-            else:
-                # Start of code block
-                result_lines.append(line)  # Add opening ```
-                in_code_block = True
-        elif in_code_block:
-            code_block_lines.append(line)
+    """Fix template literals by wrapping entire code blocks with raw tags.
+
+    Uses bytes.find (C memmem) to locate fences and template literals;
+    the markers are plain literals so no regex engine is needed.
+    """
+    # Pre-size the buffer: output is the input plus ~22 bytes of raw tags
+    # per wrapped block, so one allocation up front avoids realloc churn
+    out = bytearray(len(content) + (content.count(b'```') // 2 + 1) * 24)
+    write_pos = 0
+
+    def emit(segment):
+        nonlocal write_pos
+        end = write_pos + len(segment)
+        out[write_pos:end] = segment
+        write_pos = end
+
+    pos = 0
+    while True:
+        open_idx = _find_fence(content, pos)
+        if open_idx == -1:
+            break
+        body_start = content.find(b'\n', open_idx)
+        if body_start == -1:
+            break  # fence at EOF with no body
+        body_start += 1
+        close_idx = _find_fence(content, body_start)
+        if close_idx == -1:
+            break  # unterminated block, leave the rest untouched
+        emit(content[pos:body_start])
+        body = content[body_start:close_idx]
+        if b'${' in body:
+            emit(b'{% raw %}\n')
+            emit(body)
+            emit(b'{% endraw %}\n')
         else:
-            result_lines.append(line)
-    
-    return '\n'.join(result_lines)
+            emit(body)
+        emit(b'```')
+        pos = close_idx + 3
+    emit(content[pos:])
+    del out[write_pos:]
+    return bytes(out)
+
+def transform(content):
+    """Apply all fixes in one pass: strip stale raw tags, then re-wrap.
+
+    Takes and returns bytes; consolidates what clean_fix.py and
+    fix_liquid.py used to do in separate read/write cycles.
+    """
+    content = _STRIP_RAW_RE.sub(b'', content)
+    return fix_template_literals(content)
 
-def process_file(filepath):
+def process_file(filepath, cache=None):
     """Process a single markdown file."""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        if '${' in content:
-            fixed_content = fix_template_literals(content)
-            if fixed_content != content:
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(fixed_content)
-                print(f"Fixed: {filepath}")
-                return True
+        # mmap lets the kernel page the file in lazily; the marker scans
+        # are C-level searches that stop at the first hit, so files with
+        # nothing to fix never get fully read or decoded
+        with open(filepath, 'rb') as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                return False  # empty file
+            with mm:
+                if mm.find(b'${') == -1 and mm.find(b'{% raw %}') == -1:
+                    return False
+                content = mm[:]
+
+        if cache is not None:
+            content_key = _content_hash(content)
+            if cache.get(content_key) == 'clean':
+                return False
+
+        fixed_content = transform(content)
+        if fixed_content != content:
+            with open(filepath, 'wb') as f:
+                f.write(fixed_content)
+            if cache is not None:
+                # transform is idempotent, so the output is known-clean
+                cache[_content_hash(fixed_content)] = 'clean'
+            print(f"Fixed: {filepath}")
+            return True
+        elif cache is not None:
+            cache[content_key] = 'clean'
     except Exception as e:
         print(f"Error processing {filepath}: {e}")
-    
+
     return False
 
+def iter_md_files(root):
+    """Yield paths of all markdown files under root, pruning .git entirely."""
+    for entry in os.scandir(root):
+        if entry.is_dir(follow_symlinks=False):
+            if entry.name == '.git':
+                continue
+            yield from iter_md_files(entry.path)
+        elif entry.name.endswith('.md'):
+            yield entry.path
+
 def main():
     """Process all markdown files."""
-    fixed_count = 0
-    
-    for root, dirs, files in os.walk('.'):
-        if '.git' in root:
-            continue
-        
-        for file in files:
-            if file.endswith('.md'):
-                filepath = os.path.join(root, file)
-                if process_file(filepath):
-                    fixed_count += 1
-    
+    md_files = list(iter_md_files('.'))
+    cache = _load_cache()
+
+    # I/O-bound per-file work, so threads overlap the reads and writes
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        fixed_count = sum(executor.map(partial(process_file, cache=cache), md_files))
+
+    _save_cache(cache)
     print(f"Fixed {fixed_count} files total")
 
 if __name__ == '__main__':